@@ -27,7 +27,7 @@ from tools.market_tools import register_market_tools
 # Import all component registration functions
 from tools.property_tools import register_property_tools
 from tools.system_tools import register_system_tools
-from utils import data_manager
+from utils import data_manager, default_snapshot_dir
 
 # Create the FastMCP server
 mcp = FastMCP("Real Estate MCP Server")
@@ -69,6 +69,11 @@ async def main():
     # Register all components
     register_all_components()
 
+    # Keep parsed snapshots in the user cache dir for faster warm starts, then
+    # load all data files up front so the first request doesn't pay for it
+    data_manager.snapshot_dir = default_snapshot_dir()
+    data_manager.preload()
+
     # Log startup information to stderr
     logger.info("Real Estate MCP Server Starting...")
     logger.info(f"Loaded {len(data_manager.get_all_properties())} properties")
@@ -15,8 +15,6 @@ def register_client_resources(mcp: FastMCP):
     @mcp.resource("realestate://client/{client_id}/matches")
     def get_client_matches_resource(client_id: str) -> str:
         """Properties matching a client's preferences"""
-        from utils import PropertyFilter
-
         client = data_manager.get_client_by_id(client_id)
         if not client:
             return json.dumps(
@@ -35,20 +33,7 @@ def register_client_resources(mcp: FastMCP):
             )
 
         preferences = client.get("preferences", {})
-        budget = preferences.get("budget_range", {})
-
-        filters = PropertyFilter(
-            min_price=budget.get("min"),
-            max_price=budget.get("max"),
-            areas=preferences.get("desired_areas"),
-            property_types=(
-                [preferences.get("property_type")]
-                if preferences.get("property_type")
-                else None
-            ),
-        )
-
-        matching_properties = data_manager.filter_properties(filters)
+        matching_properties = data_manager.match_clients_to_properties(client_id)
 
         return json.dumps(
             {
@@ -12,6 +12,7 @@ from tools.area_tools import register_area_tools
 from tools.client_tools import register_client_tools
 from tools.market_tools import register_market_tools
 from tools.system_tools import register_system_tools
+from utils import RealEstateDataManager
 
 
 class TestAgentTools:
@@ -150,6 +151,20 @@ class TestClientTools:
             assert data["client_id"] == "CLI001"
             assert "matching_properties" in data
 
+    def test_match_client_preferences_multiple_property_types(self, mock_mcp):
+        """Test match_client_preferences for a buyer listing several property types"""
+        bundled_data_manager = RealEstateDataManager()
+        with patch("tools.client_tools.data_manager", bundled_data_manager):
+            result = mock_mcp["match_client_preferences"]("CLIENT005")
+            data = json.loads(result)
+
+            preferences = data["preferences"]
+            assert isinstance(preferences["property_type"], list)
+            assert data["matching_properties_count"] > 0
+            for prop in data["matching_properties"]:
+                assert prop["property_type"] in preferences["property_type"]
+                assert prop["area"] in preferences["desired_areas"]
+
 
 class TestAreaTools:
     """Test area-related MCP tools"""
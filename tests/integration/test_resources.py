@@ -14,6 +14,7 @@ from resources import (
     register_market_resources,
     register_property_resources,
 )
+from utils import RealEstateDataManager
 
 
 class TestPropertyResources:
@@ -197,6 +198,18 @@ class TestClientResources:
             assert data["client_id"] == "CLI001"
             assert "matching_properties" in data
 
+    def test_client_matches_multiple_property_types(self, mock_mcp):
+        """Test client matches for a buyer listing several property types"""
+        bundled_data_manager = RealEstateDataManager()
+        with patch("resources.client_resources.data_manager", bundled_data_manager):
+            result = mock_mcp["realestate://client/{client_id}/matches"]("CLIENT005")
+            data = json.loads(result)
+
+            preferences = data["preferences"]
+            assert data["matching_properties_count"] > 0
+            for prop in data["matching_properties"]:
+                assert prop["property_type"] in preferences["property_type"]
+
     def test_client_matches_nonexistent(self, mock_mcp, test_data_manager):
         """Test client matches with non-existent client"""
         with patch("resources.client_resources.data_manager", test_data_manager):
@@ -8,7 +8,8 @@ from unittest.mock import mock_open, patch
 
 import pytest
 
-from utils import PropertyFilter, RealEstateDataManager
+import utils
+from utils import PropertyFilter, RealEstateDataManager, get_data_manager
 
 
 class TestPropertyFilter:
@@ -54,6 +55,18 @@ class TestRealEstateDataManager:
         assert hasattr(test_data_manager, "agents")
         assert hasattr(test_data_manager, "clients")
 
+    def test_data_loaded_lazily(self, temp_data_dir):
+        """Test data files are only loaded on first access or preload"""
+        manager = RealEstateDataManager(data_dir=temp_data_dir)
+        assert manager._cache == {}
+
+        manager.get_all_agents()
+        assert "agents" in manager.__dict__
+        assert "properties" not in manager.__dict__
+
+        manager.preload()
+        assert len(manager._cache) == 7
+
     def test_get_all_properties(self, test_data_manager):
         """Test getting all properties"""
         properties = test_data_manager.get_all_properties()
@@ -94,6 +107,18 @@ class TestRealEstateDataManager:
         results = test_data_manager.search_properties("Nonexistent")
         assert len(results) == 0
 
+    def test_search_properties_batch(self, test_data_manager):
+        """Test searching for several queries at once"""
+        queries = ["Test St", "pool", "Nonexistent"]
+        results = test_data_manager.search_properties_batch(queries)
+        for query in queries:
+            expected = test_data_manager.search_properties(query)
+            assert results[query] == expected
+
+        # Same results without the optional Aho-Corasick backend
+        with patch("utils.ahocorasick", None):
+            assert test_data_manager.search_properties_batch(queries) == results
+
     def test_filter_properties(self, test_data_manager):
         """Test property filtering functionality"""
         # Filter by price range
@@ -113,6 +138,19 @@ class TestRealEstateDataManager:
         results = test_data_manager.filter_properties(filters)
         assert len(results) == 2
 
+        # Filter by area and property type
+        filters = PropertyFilter(
+            areas=["Test Area", "Other Area"], property_types=["Townhouse"]
+        )
+        results = test_data_manager.filter_properties(filters)
+        assert [prop["id"] for prop in results] == ["TEST002"]
+
+        # Filter by feature (case-insensitive)
+        filters = PropertyFilter(features=["pool"])
+        results = test_data_manager.filter_properties(filters)
+        assert len(results) == 1
+        assert results[0]["id"] == "TEST002"
+
         # Filter with no matches
         filters = PropertyFilter(min_price=1000000)
         results = test_data_manager.filter_properties(filters)
@@ -136,6 +174,14 @@ class TestRealEstateDataManager:
         filters = PropertyFilter(max_price=400000)
         assert test_data_manager._matches_filter(prop, filters) is False
 
+        # Test zero bounds are applied rather than ignored
+        filters = PropertyFilter(max_price=0)
+        assert test_data_manager._matches_filter(prop, filters) is False
+
+        # Test property without a price never satisfies a price bound
+        filters = PropertyFilter(min_price=0)
+        assert test_data_manager._matches_filter({}, filters) is False
+
     def test_matches_filter_bedrooms(self, test_data_manager):
         """Test bedroom filtering logic"""
         prop = {"bedrooms": 3}
@@ -174,11 +220,29 @@ class TestRealEstateDataManager:
         filters = PropertyFilter(features=["Garage", "Garden"])
         assert test_data_manager._matches_filter(prop, filters) is True
 
+    def test_matches_filter_features_reused_id(self, test_data_manager):
+        """Test cached features are not applied to a different record"""
+        prop = {"features": ["Basement"]}
+        indexed = test_data_manager.get_all_properties()[0]
+        # Simulate a new record whose id() collides with an indexed one
+        test_data_manager._prop_features_lower[id(prop)] = (
+            test_data_manager._prop_features_lower[id(indexed)]
+        )
+
+        filters = PropertyFilter(features=["Basement"])
+        assert test_data_manager._matches_filter(prop, filters) is True
+        filters = PropertyFilter(features=["Garage"])
+        assert test_data_manager._matches_filter(prop, filters) is False
+
     def test_get_properties_by_area(self, test_data_manager):
         """Test getting properties by area"""
         properties = test_data_manager.get_properties_by_area("Test Area")
         assert len(properties) == 2
 
+        # Area matching is case-insensitive
+        properties = test_data_manager.get_properties_by_area("test area")
+        assert len(properties) == 2
+
         properties = test_data_manager.get_properties_by_area("Nonexistent Area")
         assert len(properties) == 0
 
@@ -191,6 +255,20 @@ class TestRealEstateDataManager:
         properties = test_data_manager.get_properties_by_agent("NONEXISTENT")
         assert len(properties) == 0
 
+        # Bucketed getters return the shared index list rather than a copy
+        assert test_data_manager.get_properties_by_agent(
+            "AGENT001"
+        ) is test_data_manager.get_properties_by_agent("AGENT001")
+
+    def test_get_area_amenities(self, test_data_manager):
+        """Test getting amenities for an area"""
+        amenities = test_data_manager.get_area_amenities("test area")
+        assert len(amenities["parks"]) == 1
+        assert amenities["parks"][0]["name"] == "Test Park"
+
+        amenities = test_data_manager.get_area_amenities("Nonexistent Area")
+        assert amenities["parks"] == []
+
     def test_get_all_agents(self, test_data_manager):
         """Test getting all agents"""
         agents = test_data_manager.get_all_agents()
@@ -210,6 +288,18 @@ class TestRealEstateDataManager:
         agent = test_data_manager.get_agent_by_id("NONEXISTENT")
         assert agent is None
 
+    def test_get_agent_performance(self, test_data_manager):
+        """Test agent performance metrics"""
+        performance = test_data_manager.get_agent_performance("AGENT001")
+        assert performance["agent_id"] == "AGENT001"
+        assert performance["active_listings"] == 1
+        assert performance["recent_sales_count"] == 0
+        assert performance["total_sales_volume"] == 0
+        assert performance["client_rating"] == 0
+
+        # Test non-existent agent
+        assert test_data_manager.get_agent_performance("NONEXISTENT") == {}
+
     def test_search_agents(self, test_data_manager):
         """Test agent search functionality"""
         # Search by name
@@ -244,6 +334,38 @@ class TestRealEstateDataManager:
         client = test_data_manager.get_client_by_id("NONEXISTENT")
         assert client is None
 
+    def test_refresh_data_in_subclass(self, temp_data_dir):
+        """Test refresh also drops data cached by base class properties"""
+
+        class CustomDataManager(RealEstateDataManager):
+            pass
+
+        manager = CustomDataManager(data_dir=temp_data_dir)
+        assert len(manager.get_all_properties()) == 2
+
+        filepath = os.path.join(temp_data_dir, "properties", "active_listings.json")
+        with open(filepath, "w") as f:
+            json.dump({"active_listings": []}, f)
+
+        manager.refresh_data()
+        assert manager.get_all_properties() == []
+        assert manager.get_property_by_id("TEST001") is None
+
+    def test_match_clients_to_properties(self, test_data_manager):
+        """Test matching properties to a buyer's preferences"""
+        results = test_data_manager.match_clients_to_properties("CLI001")
+        assert [prop["id"] for prop in results] == ["TEST001"]
+
+        # Clients may list several preferred property types
+        client = test_data_manager.get_client_by_id("CLI001")
+        client["preferences"]["property_type"] = ["Townhouse", "Single Family Home"]
+        client["preferences"]["budget_range"] = {"min": 300000, "max": 600000}
+        results = test_data_manager.match_clients_to_properties("CLI001")
+        assert [prop["id"] for prop in results] == ["TEST001", "TEST002"]
+
+        # Test non-existent client
+        assert test_data_manager.match_clients_to_properties("NONEXISTENT") == []
+
     def test_refresh_data(self, test_data_manager):
         """Test data refresh functionality"""
         # Modify cache
@@ -254,6 +376,33 @@ class TestRealEstateDataManager:
         test_data_manager.refresh_data()
         assert "test" not in test_data_manager._cache
 
+    def test_refresh_data_rebuilds_indexes(self, test_data_manager, temp_data_dir):
+        """Test lookups reflect changed data files after a refresh"""
+        assert test_data_manager.get_property_by_id("TEST001") is not None
+
+        filepath = os.path.join(temp_data_dir, "properties", "active_listings.json")
+        with open(filepath, "w") as f:
+            json.dump({"active_listings": [{"id": "TEST003", "area": "New Area"}]}, f)
+
+        assert test_data_manager.get_property_by_id("TEST003") is None
+
+        test_data_manager.refresh_data()
+        assert test_data_manager.get_property_by_id("TEST003") is not None
+        assert test_data_manager.get_property_by_id("TEST001") is None
+
+    def test_report_caching(self, test_data_manager):
+        """Test cross-referenced reports are cached until a refresh"""
+        report = test_data_manager.get_agent_dashboard("AGENT001")
+        assert report["agent_info"]["id"] == "AGENT001"
+        assert test_data_manager.get_agent_dashboard("AGENT001") is report
+
+        test_data_manager.refresh_data()
+        assert test_data_manager.get_agent_dashboard("AGENT001") is not report
+
+        # Reports for unknown areas are not cached
+        test_data_manager.get_comprehensive_area_report("Nonexistent Area")
+        assert ("area", "Nonexistent Area") not in test_data_manager._report_cache
+
     def test_load_json_file_caching(self, test_data_manager, temp_data_dir):
         """Test JSON file loading with caching"""
         filepath = os.path.join(temp_data_dir, "properties", "active_listings.json")
@@ -266,6 +415,39 @@ class TestRealEstateDataManager:
         data2 = test_data_manager._load_json_file(filepath)
         assert data1 is data2  # Same object reference
 
+    def test_load_json_file_snapshot(self, temp_data_dir, tmp_path):
+        """Test parsed data is reused from the snapshot in snapshot_dir"""
+        pytest.importorskip("msgpack")
+        snapshot_dir = str(tmp_path / "snapshots")
+        filepath = os.path.join(temp_data_dir, "agents", "agent_profiles.json")
+        data = RealEstateDataManager(
+            data_dir=temp_data_dir, snapshot_dir=snapshot_dir
+        )._load_json_file(filepath)
+        assert len(os.listdir(snapshot_dir)) == 1
+        assert os.listdir(os.path.dirname(filepath)) == ["agent_profiles.json"]
+
+        # A fresh manager loads the snapshot without parsing the JSON
+        with patch("utils._json_loads", side_effect=AssertionError):
+            manager = RealEstateDataManager(
+                data_dir=temp_data_dir, snapshot_dir=snapshot_dir
+            )
+            assert manager._load_json_file(filepath) == data
+
+        # A changed source file makes the snapshot stale
+        with open(filepath, "w") as f:
+            json.dump({"agents": []}, f)
+        manager = RealEstateDataManager(
+            data_dir=temp_data_dir, snapshot_dir=snapshot_dir
+        )
+        assert manager._load_json_file(filepath) == {"agents": []}
+
+    def test_load_json_file_without_snapshot_dir(self, temp_data_dir):
+        """Test plain reads write no snapshot files by default"""
+        manager = RealEstateDataManager(data_dir=temp_data_dir)
+        manager.preload()
+        for _, _, files in os.walk(temp_data_dir):
+            assert all(name.endswith(".json") for name in files)
+
     def test_load_json_file_error_handling(self, test_data_manager):
         """Test JSON file loading error handling"""
         # Test non-existent file
@@ -276,3 +458,19 @@ class TestRealEstateDataManager:
         with patch("builtins.open", mock_open(read_data="invalid json")):
             data = test_data_manager._load_json_file("invalid.json")
             assert data == {}
+
+
+class TestGetDataManager:
+    """Test the shared data manager accessor"""
+
+    def test_get_data_manager_returns_shared_instance(self):
+        """Test the shared instance is created once and reused"""
+        manager = get_data_manager()
+        assert isinstance(manager, RealEstateDataManager)
+        assert get_data_manager() is manager
+        assert utils.data_manager is manager
+
+    def test_unknown_module_attribute(self):
+        """Test unknown module attributes still raise AttributeError"""
+        with pytest.raises(AttributeError):
+            utils.not_a_real_attribute
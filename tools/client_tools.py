@@ -6,7 +6,7 @@ import json
 
 from mcp.server.fastmcp import FastMCP
 
-from utils import PropertyFilter, data_manager
+from utils import data_manager
 
 
 def register_client_tools(mcp: FastMCP):
@@ -37,20 +37,7 @@ def register_client_tools(mcp: FastMCP):
             return f"Client {client_id} is not a buyer (type: {client.get('type')})"
 
         preferences = client.get("preferences", {})
-        budget = preferences.get("budget_range", {})
-
-        filters = PropertyFilter(
-            min_price=budget.get("min"),
-            max_price=budget.get("max"),
-            areas=preferences.get("desired_areas"),
-            property_types=(
-                [preferences.get("property_type")]
-                if preferences.get("property_type")
-                else None
-            ),
-        )
-
-        matching_properties = data_manager.filter_properties(filters)
+        matching_properties = data_manager.match_clients_to_properties(client_id)
 
         return json.dumps(
             {
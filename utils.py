@@ -3,13 +3,43 @@ Real Estate Data Utilities
 Comprehensive utilities for managing and querying real estate data
 """
 
+import hashlib
 import json
 import os
 import sys
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    _json_loads = json.loads
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional; without it snapshots are skipped
+    msgpack = None
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; batch search scans per query
+    ahocorasick = None
+
+
+def default_snapshot_dir() -> str:
+    """Per-user cache directory for parsed data snapshots"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "real-estate-mcp", "snapshots")
+
 
 @dataclass
 class PropertyFilter:
@@ -31,59 +61,415 @@ class PropertyFilter:
 class RealEstateDataManager:
     """Centralized manager for all real estate data"""
 
-    def __init__(self, data_dir: str = None):
+    # Data sets loaded from data_dir, in the order preload() submits them
+    _DATASETS = (
+        "properties",
+        "agents",
+        "market",
+        "clients",
+        "amenities",
+        "transactions",
+        "areas",
+    )
+
+    def __init__(self, data_dir: str = None, snapshot_dir: str = None):
         # Use absolute path relative to this file's location
         if data_dir is None:
             # Get the directory where utils.py is located
             base_dir = Path(__file__).parent.resolve()
             data_dir = base_dir / "data"
         self.data_dir = str(data_dir)
+        # Directory for parsed msgpack snapshots of the data files; None
+        # disables them
+        self.snapshot_dir = None if snapshot_dir is None else str(snapshot_dir)
         self._cache = {}
-        self._load_all_data()
+        # Cross-referenced reports, keyed by (report kind, argument)
+        self._report_cache = {}
 
     def _load_json_file(self, filepath: str) -> Dict[str, Any]:
         """Load JSON file with caching"""
         if filepath in self._cache:
             return self._cache[filepath]
 
+        source_stat = None
+        if self.snapshot_dir is not None:
+            try:
+                source_stat = os.stat(filepath)
+            except OSError:
+                pass
+
+        data = self._load_snapshot(filepath, source_stat)
+        if data is not None:
+            self._cache[filepath] = data
+            return data
+
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(filepath, "rb") as f:
+                data = _json_loads(f.read())
                 self._cache[filepath] = data
-                return data
         except (FileNotFoundError, json.JSONDecodeError) as e:
             # Log the error for debugging
             print(f"Warning: Failed to load {filepath}: {e}", file=sys.stderr)
             return {}
 
-    def _load_all_data(self):
-        """Load all data files"""
-        self.properties = self._load_json_file(
-            os.path.join(self.data_dir, "properties", "active_listings.json")
-        )
-        self.agents = self._load_json_file(
-            os.path.join(self.data_dir, "agents", "agent_profiles.json")
+        self._write_snapshot(filepath, source_stat, data)
+        return data
+
+    def _snapshot_path(self, filepath: str) -> str:
+        """Path of the parsed snapshot of a data file in snapshot_dir"""
+        source = os.path.abspath(filepath)
+        digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        return os.path.join(self.snapshot_dir, f"{digest}.msgpack")
+
+    def _load_snapshot(
+        self, filepath: str, source_stat: Optional[os.stat_result]
+    ) -> Optional[Dict[str, Any]]:
+        """Load the parsed snapshot of a data file if it is still current"""
+        if msgpack is None or source_stat is None:
+            return None
+        try:
+            with open(self._snapshot_path(filepath), "rb") as f:
+                source, mtime_ns, size, data = msgpack.unpackb(f.read(), raw=False)
+        except (OSError, ValueError, TypeError, msgpack.UnpackException):
+            return None
+        if (source, mtime_ns, size) != (
+            os.path.abspath(filepath),
+            source_stat.st_mtime_ns,
+            source_stat.st_size,
+        ):
+            return None
+        return data
+
+    def _write_snapshot(
+        self,
+        filepath: str,
+        source_stat: Optional[os.stat_result],
+        data: Dict[str, Any],
+    ):
+        """Save parsed data to snapshot_dir for faster warm starts"""
+        if msgpack is None or source_stat is None:
+            return
+        snapshot_path = self._snapshot_path(filepath)
+        temp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+        try:
+            packed = msgpack.packb(
+                (
+                    os.path.abspath(filepath),
+                    source_stat.st_mtime_ns,
+                    source_stat.st_size,
+                    data,
+                ),
+                use_bin_type=True,
+            )
+            os.makedirs(self.snapshot_dir, exist_ok=True)
+            with open(temp_path, "wb") as f:
+                f.write(packed)
+            os.replace(temp_path, snapshot_path)
+        except (OSError, ValueError, TypeError, OverflowError):
+            # Snapshots are only an optimization, e.g. the cache dir may be
+            # read-only or the data may not fit msgpack's types
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    def _data_path(self, *parts: str) -> str:
+        """Build the path of a data file under data_dir"""
+        return os.path.join(self.data_dir, *parts)
+
+    # Data files, each loaded on first access
+    @cached_property
+    def properties(self) -> Dict[str, Any]:
+        """Active listings data"""
+        return self._load_json_file(
+            self._data_path("properties", "active_listings.json")
         )
-        self.market = self._load_json_file(
-            os.path.join(self.data_dir, "market", "market_analytics.json")
+
+    @cached_property
+    def agents(self) -> Dict[str, Any]:
+        """Agent profile data"""
+        return self._load_json_file(self._data_path("agents", "agent_profiles.json"))
+
+    @cached_property
+    def market(self) -> Dict[str, Any]:
+        """Market analytics data"""
+        return self._load_json_file(self._data_path("market", "market_analytics.json"))
+
+    @cached_property
+    def clients(self) -> Dict[str, Any]:
+        """Client database"""
+        return self._load_json_file(self._data_path("clients", "client_database.json"))
+
+    @cached_property
+    def amenities(self) -> Dict[str, Any]:
+        """Local amenities data"""
+        return self._load_json_file(
+            self._data_path("amenities", "local_amenities.json")
         )
-        self.clients = self._load_json_file(
-            os.path.join(self.data_dir, "clients", "client_database.json")
+
+    @cached_property
+    def transactions(self) -> Dict[str, Any]:
+        """Recent sales data"""
+        return self._load_json_file(
+            self._data_path("transactions", "recent_sales.json")
         )
-        self.amenities = self._load_json_file(
-            os.path.join(self.data_dir, "amenities", "local_amenities.json")
+
+    @cached_property
+    def areas(self) -> Dict[str, Any]:
+        """City and area overview data"""
+        return self._load_json_file(self._data_path("areas", "city_overview.json"))
+
+    def preload(self):
+        """Load every data file now rather than on first access"""
+        # The files are independent, so read and parse them concurrently
+        with ThreadPoolExecutor(max_workers=len(self._DATASETS)) as executor:
+            list(executor.map(lambda name: getattr(self, name), self._DATASETS))
+
+    # Lookup indexes, each built on first access. Derived values are kept
+    # beside the records so they never leak into the data returned to clients.
+    # Id indexes keep the first record for duplicate keys, matching a linear scan
+    @cached_property
+    def _prop_by_id(self) -> Dict[str, Dict[str, Any]]:
+        """Properties keyed by ID"""
+        index = {}
+        for prop in self.get_all_properties():
+            if "id" in prop:
+                index.setdefault(prop["id"], prop)
+        return index
+
+    @cached_property
+    def _agent_by_id(self) -> Dict[str, Dict[str, Any]]:
+        """Agents keyed by ID"""
+        index = {}
+        for agent in self.get_all_agents():
+            if "id" in agent:
+                index.setdefault(agent["id"], agent)
+        return index
+
+    @cached_property
+    def _client_by_id(self) -> Dict[str, Dict[str, Any]]:
+        """Clients keyed by ID"""
+        index = {}
+        for client in self.get_all_clients():
+            if "id" in client:
+                index.setdefault(client["id"], client)
+        return index
+
+    @cached_property
+    def _area_by_name_lower(self) -> Dict[str, Dict[str, Any]]:
+        """Areas keyed by lowercased name"""
+        index = {}
+        for area in self.get_all_areas():
+            if area.get("name"):
+                index.setdefault(area["name"].lower(), area)
+        return index
+
+    @cached_property
+    def _price_index(self) -> tuple:
+        """Sorted prices and the listing positions of the matching properties"""
+        priced = sorted(
+            (prop["price"], pos)
+            for pos, prop in enumerate(self.get_all_properties())
+            if prop.get("price") is not None
         )
-        self.transactions = self._load_json_file(
-            os.path.join(self.data_dir, "transactions", "recent_sales.json")
+        return [price for price, _ in priced], [pos for _, pos in priced]
+
+    @cached_property
+    def _positions_by_area_type(self) -> Dict[str, Dict[str, List[int]]]:
+        """Listing positions grouped by area, then by property type"""
+        buckets = defaultdict(lambda: defaultdict(list))
+        for pos, prop in enumerate(self.get_all_properties()):
+            buckets[prop.get("area")][prop.get("property_type")].append(pos)
+        return buckets
+
+    @cached_property
+    def _props_by_agent(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Properties grouped by agent ID"""
+        buckets = defaultdict(list)
+        for prop in self.get_all_properties():
+            buckets[prop.get("agent_id")].append(prop)
+        return buckets
+
+    @cached_property
+    def _props_by_area_lower(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Properties grouped by lowercased area"""
+        buckets = defaultdict(list)
+        for prop in self.get_all_properties():
+            buckets[prop.get("area", "").lower()].append(prop)
+        return buckets
+
+    @cached_property
+    def _sales_by_agent(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Recent sales grouped by agent ID"""
+        buckets = defaultdict(list)
+        for sale in self.get_recent_sales():
+            buckets[sale.get("agent_id")].append(sale)
+        return buckets
+
+    @cached_property
+    def _sales_by_area_lower(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Recent sales grouped by lowercased area"""
+        buckets = defaultdict(list)
+        for sale in self.get_recent_sales():
+            buckets[sale.get("area", "").lower()].append(sale)
+        return buckets
+
+    @cached_property
+    def _sales_totals(self) -> Dict[Optional[str], List[float]]:
+        """Sale count and price, days and price/sqft sums by lowercased area
+
+        The None key holds the totals across all areas.
+        """
+        totals = {}
+        for sale in self.get_recent_sales():
+            values = (
+                sale.get("sale_price", 0),
+                sale.get("days_on_market", 0),
+                sale.get("price_per_sqft", 0),
+            )
+            for key in (None, sale.get("area", "").lower()):
+                bucket = totals.setdefault(key, [0, 0, 0, 0])
+                bucket[0] += 1
+                bucket[1] += values[0]
+                bucket[2] += values[1]
+                bucket[3] += values[2]
+        return totals
+
+    @cached_property
+    def _clients_by_agent(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Clients grouped by agent ID"""
+        buckets = defaultdict(list)
+        for client in self.get_all_clients():
+            buckets[client.get("agent_id")].append(client)
+        return buckets
+
+    @cached_property
+    def _agent_sales_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Sales and rating rollups from each agent's profile, keyed by agent ID"""
+        stats = {}
+        for agent_id, agent in self._agent_by_id.items():
+            recent_sales = agent.get("recent_sales", [])
+            stats[agent_id] = {
+                "recent_sales_count": len(recent_sales),
+                "avg_days_on_market": self._calculate_avg_days_on_market(
+                    recent_sales
+                ),
+                "total_sales_volume": sum(
+                    sale.get("sale_price", 0) for sale in recent_sales
+                ),
+                "client_rating": self._calculate_avg_rating(
+                    agent.get("client_testimonials", [])
+                ),
+            }
+        return stats
+
+    @cached_property
+    def _parks_by_area_lower(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Parks grouped by lowercased area"""
+        buckets = defaultdict(list)
+        parks = self.amenities.get("parks_and_recreation", {}).get("parks", [])
+        for park in parks:
+            buckets[park.get("area", "").lower()].append(park)
+        return buckets
+
+    @cached_property
+    def _shop_types(self) -> List[str]:
+        """Shop categories listed in the shopping data"""
+        shopping = self.amenities.get("shopping", {})
+        return [
+            shop_type
+            for shop_type, shops in shopping.items()
+            if isinstance(shops, list)
+        ]
+
+    @cached_property
+    def _shops_by_area_lower(self) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        """Shops grouped by lowercased area, then by shop category"""
+        buckets = defaultdict(lambda: defaultdict(list))
+        shopping = self.amenities.get("shopping", {})
+        for shop_type in self._shop_types:
+            for shop in shopping[shop_type]:
+                buckets[shop.get("area", "").lower()][shop_type].append(shop)
+        return buckets
+
+    @cached_property
+    def _prop_features_lower(self) -> Dict[int, tuple]:
+        """Each property with its lowercased feature set and list, keyed by id()
+
+        The property is stored in each entry so lookups can confirm identity;
+        an id() may be reused by a new record once the original is freed.
+        """
+        return {
+            id(prop): (prop, *self._lowered_features(prop))
+            for prop in self.get_all_properties()
+        }
+
+    @staticmethod
+    def _lowered_features(prop: Dict[str, Any]) -> tuple:
+        """Lowercased feature names of a property as a set and a list"""
+        features = [feature.lower() for feature in prop.get("features", [])]
+        return frozenset(features), features
+
+    @cached_property
+    def _prop_search_index(self) -> List[tuple]:
+        """Lowercased property search text paired with each property"""
+        return [
+            (self._property_search_text(prop), prop)
+            for prop in self.get_all_properties()
+        ]
+
+    @cached_property
+    def _agent_search_index(self) -> List[tuple]:
+        """Lowercased agent search text paired with each agent"""
+        return [
+            (self._agent_search_text(agent), agent) for agent in self.get_all_agents()
+        ]
+
+    @staticmethod
+    def _property_search_text(prop: Dict[str, Any]) -> str:
+        """Build the lowercased text a property query is matched against"""
+        # Search in address, description, features, and area
+        return " ".join(
+            field.lower()
+            for field in (
+                prop.get("address", ""),
+                prop.get("description", ""),
+                prop.get("area", ""),
+                *prop.get("features", []),
+                prop.get("property_type", ""),
+                prop.get("style", ""),
+            )
         )
-        self.areas = self._load_json_file(
-            os.path.join(self.data_dir, "areas", "city_overview.json")
+
+    @staticmethod
+    def _agent_search_text(agent: Dict[str, Any]) -> str:
+        """Build the lowercased text an agent query is matched against"""
+        return " ".join(
+            field.lower()
+            for field in (
+                agent.get("name", ""),
+                *agent.get("specializations", []),
+                *agent.get("expertise_areas", []),
+                agent.get("bio", ""),
+            )
         )
 
     def refresh_data(self):
         """Refresh all cached data"""
+        if self.snapshot_dir is not None:
+            for filepath in self._cache:
+                try:
+                    os.remove(self._snapshot_path(filepath))
+                except OSError:
+                    pass
         self._cache.clear()
-        self._load_all_data()
+        self._report_cache.clear()
+        # Drop loaded data and indexes, including those defined on base
+        # classes, so they are rebuilt on next access
+        for cls in type(self).__mro__:
+            for name, attr in vars(cls).items():
+                if isinstance(attr, cached_property):
+                    self.__dict__.pop(name, None)
 
     # Property Operations
     def get_all_properties(self) -> List[Dict[str, Any]]:
@@ -92,115 +478,180 @@ class RealEstateDataManager:
 
     def get_property_by_id(self, property_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific property by ID"""
-        for prop in self.get_all_properties():
-            if prop.get("id") == property_id:
-                return prop
-        return None
+        return self._prop_by_id.get(property_id)
 
     def filter_properties(self, filters: PropertyFilter) -> List[Dict[str, Any]]:
         """Filter properties based on criteria"""
+        prepared = self._prepare_filter(filters)
         properties = self.get_all_properties()
-        filtered = []
 
-        for prop in properties:
-            if self._matches_filter(prop, filters):
-                filtered.append(prop)
+        positions = self._candidate_positions(filters, prepared)
+        candidates = (
+            properties if positions is None else [properties[pos] for pos in positions]
+        )
+
+        return [
+            prop
+            for prop in candidates
+            if self._matches_filter(prop, filters, prepared)
+        ]
 
-        return filtered
+    def _candidate_positions(
+        self, filters: PropertyFilter, prepared: tuple
+    ) -> Optional[List[int]]:
+        """Narrow a filter to listing positions using the indexes, None for all"""
+        areas, property_types, _ = prepared
+        positions = None
+
+        # Union of the matching area and property type buckets
+        if areas or property_types:
+            positions = set()
+            by_area = self._positions_by_area_type
+            for area in areas or by_area.keys():
+                by_type = by_area.get(area, {})
+                for property_type in property_types or by_type.keys():
+                    positions.update(by_type.get(property_type, ()))
+
+        # Requested price range, found with a binary search
+        if filters.min_price is not None or filters.max_price is not None:
+            prices, price_positions = self._price_index
+            low = 0
+            if filters.min_price is not None:
+                low = bisect_left(prices, filters.min_price)
+            high = len(prices)
+            if filters.max_price is not None:
+                high = bisect_right(prices, filters.max_price)
+            in_range = price_positions[low:high]
+            if positions is None:
+                positions = set(in_range)
+            else:
+                positions.intersection_update(in_range)
+
+        # Keep candidates in listing order
+        return None if positions is None else sorted(positions)
+
+    def _prepare_filter(self, filters: PropertyFilter) -> tuple:
+        """Normalize the list criteria of a filter once per search"""
+        areas = frozenset(filters.areas) if filters.areas else None
+        property_types = (
+            frozenset(filters.property_types) if filters.property_types else None
+        )
+        features = (
+            frozenset(f.lower() for f in filters.features) if filters.features else None
+        )
+        return areas, property_types, features
 
-    def _matches_filter(self, prop: Dict[str, Any], filters: PropertyFilter) -> bool:
+    def _matches_filter(
+        self, prop: Dict[str, Any], filters: PropertyFilter, prepared: tuple = None
+    ) -> bool:
         """Check if property matches filter criteria"""
-        # Price range
-        if filters.min_price and prop.get("price", 0) < filters.min_price:
+        if prepared is None:
+            prepared = self._prepare_filter(filters)
+        areas, property_types, features = prepared
+
+        # Cheap and selective checks first so most rejects exit early
+        # Areas
+        if areas and prop.get("area") not in areas:
             return False
-        if filters.max_price and prop.get("price", float("inf")) > filters.max_price:
+
+        # Property types
+        if property_types and prop.get("property_type") not in property_types:
             return False
 
-        # Bedrooms
-        if filters.min_bedrooms and prop.get("bedrooms", 0) < filters.min_bedrooms:
+        # Numeric ranges; a bound of 0 is a real bound, and a property
+        # missing the field never satisfies a bound on it
+        price = prop.get("price")
+        if filters.min_price is not None and (
+            price is None or price < filters.min_price
+        ):
             return False
-        if (
-            filters.max_bedrooms
-            and prop.get("bedrooms", float("inf")) > filters.max_bedrooms
+        if filters.max_price is not None and (
+            price is None or price > filters.max_price
         ):
             return False
 
-        # Bathrooms
-        if filters.min_bathrooms and prop.get("bathrooms", 0) < filters.min_bathrooms:
+        bedrooms = prop.get("bedrooms")
+        if filters.min_bedrooms is not None and (
+            bedrooms is None or bedrooms < filters.min_bedrooms
+        ):
             return False
-        if (
-            filters.max_bathrooms
-            and prop.get("bathrooms", float("inf")) > filters.max_bathrooms
+        if filters.max_bedrooms is not None and (
+            bedrooms is None or bedrooms > filters.max_bedrooms
         ):
             return False
 
-        # Areas
-        if filters.areas and prop.get("area") not in filters.areas:
+        square_feet = prop.get("square_feet")
+        if filters.min_sqft is not None and (
+            square_feet is None or square_feet < filters.min_sqft
+        ):
             return False
-
-        # Property types
-        if (
-            filters.property_types
-            and prop.get("property_type") not in filters.property_types
+        if filters.max_sqft is not None and (
+            square_feet is None or square_feet > filters.max_sqft
         ):
             return False
 
-        # Square footage
-        if filters.min_sqft and prop.get("square_feet", 0) < filters.min_sqft:
+        bathrooms = prop.get("bathrooms")
+        if filters.min_bathrooms is not None and (
+            bathrooms is None or bathrooms < filters.min_bathrooms
+        ):
             return False
-        if (
-            filters.max_sqft
-            and prop.get("square_feet", float("inf")) > filters.max_sqft
+        if filters.max_bathrooms is not None and (
+            bathrooms is None or bathrooms > filters.max_bathrooms
         ):
             return False
 
-        # Features
-        if filters.features:
-            prop_features = prop.get("features", [])
-            for required_feature in filters.features:
-                if not any(
-                    required_feature.lower() in feature.lower()
-                    for feature in prop_features
-                ):
+        # Features (substring match against the property's feature names)
+        if features:
+            entry = self._prop_features_lower.get(id(prop))
+            if entry is not None and entry[0] is prop:
+                _, feature_set, prop_features = entry
+            else:
+                feature_set, prop_features = self._lowered_features(prop)
+            # Exact names are a set lookup; only the rest need a substring scan
+            for required_feature in features - feature_set:
+                if not any(required_feature in feature for feature in prop_features):
                     return False
 
         return True
 
     def search_properties(self, query: str) -> List[Dict[str, Any]]:
         """Search properties by text query"""
-        properties = self.get_all_properties()
-        results = []
         query_lower = query.lower()
+        return [
+            prop
+            for searchable_text, prop in self._prop_search_index
+            if query_lower in searchable_text
+        ]
+
+    def search_properties_batch(
+        self, queries: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Search properties for several text queries at once"""
+        query_lowers = {query: query.lower() for query in queries}
+        patterns = set(query_lowers.values())
+        if ahocorasick is None or not patterns or "" in patterns:
+            return {query: self.search_properties(query) for query in queries}
 
-        for prop in properties:
-            # Search in address, description, features, and area
-            searchable_text = " ".join(
-                [
-                    prop.get("address", ""),
-                    prop.get("description", ""),
-                    prop.get("area", ""),
-                    " ".join(prop.get("features", [])),
-                    prop.get("property_type", ""),
-                    prop.get("style", ""),
-                ]
-            ).lower()
+        # Find every query in each property's text with a single scan
+        automaton = ahocorasick.Automaton()
+        for pattern in patterns:
+            automaton.add_word(pattern, pattern)
+        automaton.make_automaton()
 
-            if query_lower in searchable_text:
-                results.append(prop)
+        matches = {pattern: [] for pattern in patterns}
+        for searchable_text, prop in self._prop_search_index:
+            for pattern in {found for _, found in automaton.iter(searchable_text)}:
+                matches[pattern].append(prop)
 
-        return results
+        return {query: list(matches[query_lowers[query]]) for query in queries}
 
     def get_properties_by_agent(self, agent_id: str) -> List[Dict[str, Any]]:
-        """Get all properties handled by a specific agent"""
-        properties = self.get_all_properties()
-        return [prop for prop in properties if prop.get("agent_id") == agent_id]
+        """Get all properties handled by a specific agent (shared list, read-only)"""
+        return self._props_by_agent.get(agent_id, [])
 
     def get_properties_by_area(self, area: str) -> List[Dict[str, Any]]:
-        """Get all properties in a specific area"""
-        properties = self.get_all_properties()
-        return [
-            prop for prop in properties if prop.get("area", "").lower() == area.lower()
-        ]
+        """Get all properties in a specific area (shared list, read-only)"""
+        return self._props_by_area_lower.get(area.lower(), [])
 
     # Agent Operations
     def get_all_agents(self) -> List[Dict[str, Any]]:
@@ -209,31 +660,16 @@ class RealEstateDataManager:
 
     def get_agent_by_id(self, agent_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific agent by ID"""
-        for agent in self.get_all_agents():
-            if agent.get("id") == agent_id:
-                return agent
-        return None
+        return self._agent_by_id.get(agent_id)
 
     def search_agents(self, query: str) -> List[Dict[str, Any]]:
         """Search agents by name, specialization, or area"""
-        agents = self.get_all_agents()
-        results = []
         query_lower = query.lower()
-
-        for agent in agents:
-            searchable_text = " ".join(
-                [
-                    agent.get("name", ""),
-                    " ".join(agent.get("specializations", [])),
-                    " ".join(agent.get("expertise_areas", [])),
-                    agent.get("bio", ""),
-                ]
-            ).lower()
-
-            if query_lower in searchable_text:
-                results.append(agent)
-
-        return results
+        return [
+            agent
+            for searchable_text, agent in self._agent_search_index
+            if query_lower in searchable_text
+        ]
 
     def get_agent_performance(self, agent_id: str) -> Dict[str, Any]:
         """Get agent performance metrics"""
@@ -241,22 +677,17 @@ class RealEstateDataManager:
         if not agent:
             return {}
 
-        properties = self.get_properties_by_agent(agent_id)
-        recent_sales = agent.get("recent_sales", [])
+        stats = self._agent_sales_stats[agent_id]
 
         return {
             "agent_id": agent_id,
             "name": agent.get("name"),
-            "active_listings": len(properties),
-            "recent_sales_count": len(recent_sales),
-            "avg_days_on_market": self._calculate_avg_days_on_market(recent_sales),
-            "total_sales_volume": sum(
-                sale.get("sale_price", 0) for sale in recent_sales
-            ),
+            "active_listings": len(self._props_by_agent.get(agent_id, [])),
+            "recent_sales_count": stats["recent_sales_count"],
+            "avg_days_on_market": stats["avg_days_on_market"],
+            "total_sales_volume": stats["total_sales_volume"],
             "specializations": agent.get("specializations", []),
-            "client_rating": self._calculate_avg_rating(
-                agent.get("client_testimonials", [])
-            ),
+            "client_rating": stats["client_rating"],
         }
 
     def _calculate_avg_days_on_market(self, sales: List[Dict[str, Any]]) -> float:
@@ -309,15 +740,11 @@ class RealEstateDataManager:
 
     def get_client_by_id(self, client_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific client by ID"""
-        for client in self.get_all_clients():
-            if client.get("id") == client_id:
-                return client
-        return None
+        return self._client_by_id.get(client_id)
 
     def get_clients_by_agent(self, agent_id: str) -> List[Dict[str, Any]]:
-        """Get all clients for a specific agent"""
-        clients = self.get_all_clients()
-        return [client for client in clients if client.get("agent_id") == agent_id]
+        """Get all clients for a specific agent (shared list, read-only)"""
+        return self._clients_by_agent.get(agent_id, [])
 
     def match_clients_to_properties(self, client_id: str) -> List[Dict[str, Any]]:
         """Match properties to client preferences"""
@@ -328,17 +755,20 @@ class RealEstateDataManager:
         preferences = client.get("preferences", {})
         budget = preferences.get("budget_range", {})
 
+        # Clients may list one preferred property type or several
+        property_types = preferences.get("property_type")
+        if isinstance(property_types, str):
+            property_types = [property_types]
+
         filters = PropertyFilter(
             min_price=budget.get("min"),
             max_price=budget.get("max"),
             areas=preferences.get("desired_areas"),
-            property_types=(
-                [preferences.get("property_type")]
-                if preferences.get("property_type")
-                else None
-            ),
+            property_types=property_types or None,
         )
 
+        # filter_properties narrows the search to the buckets for the
+        # desired areas and property types before checking each listing
         return self.filter_properties(filters)
 
     # Amenities Operations
@@ -364,29 +794,23 @@ class RealEstateDataManager:
         return self.amenities.get(amenity_type, {})
 
     def get_area_amenities(self, area: str) -> Dict[str, Any]:
-        """Get all amenities for a specific area"""
+        """Get all amenities for a specific area (lists are shared, read-only)"""
         amenities = {}
 
         # Schools
         amenities["schools"] = self.get_schools_by_area(area)
 
+        area_lower = area.lower()
+
         # Parks
-        parks = self.amenities.get("parks_and_recreation", {}).get("parks", [])
-        amenities["parks"] = [
-            park for park in parks if park.get("area", "").lower() == area.lower()
-        ]
+        amenities["parks"] = self._parks_by_area_lower.get(area_lower, [])
 
         # Shopping
-        shopping = self.amenities.get("shopping", {})
-        area_shopping = {}
-        for shop_type, shops in shopping.items():
-            if isinstance(shops, list):
-                area_shopping[shop_type] = [
-                    shop
-                    for shop in shops
-                    if shop.get("area", "").lower() == area.lower()
-                ]
-        amenities["shopping"] = area_shopping
+        area_shops = self._shops_by_area_lower.get(area_lower, {})
+        amenities["shopping"] = {
+            shop_type: area_shops.get(shop_type, [])
+            for shop_type in self._shop_types
+        }
 
         return amenities
 
@@ -396,36 +820,27 @@ class RealEstateDataManager:
         return self.transactions.get("recent_sales", [])
 
     def get_sales_by_area(self, area: str) -> List[Dict[str, Any]]:
-        """Get recent sales in a specific area"""
-        sales = self.get_recent_sales()
-        return [sale for sale in sales if sale.get("area", "").lower() == area.lower()]
+        """Get recent sales in a specific area (shared list, read-only)"""
+        return self._sales_by_area_lower.get(area.lower(), [])
 
     def get_sales_by_agent(self, agent_id: str) -> List[Dict[str, Any]]:
-        """Get recent sales by a specific agent"""
-        sales = self.get_recent_sales()
-        return [sale for sale in sales if sale.get("agent_id") == agent_id]
+        """Get recent sales by a specific agent (shared list, read-only)"""
+        return self._sales_by_agent.get(agent_id, [])
 
     def calculate_market_trends(self, area: str = None) -> Dict[str, Any]:
         """Calculate market trends based on recent sales"""
-        sales = self.get_sales_by_area(area) if area else self.get_recent_sales()
+        totals = self._sales_totals.get(area.lower() if area else None)
 
-        if not sales:
+        if not totals:
             return {}
 
-        total_sales = len(sales)
-        avg_sale_price = sum(sale.get("sale_price", 0) for sale in sales) / total_sales
-        avg_days_on_market = (
-            sum(sale.get("days_on_market", 0) for sale in sales) / total_sales
-        )
-        avg_price_per_sqft = (
-            sum(sale.get("price_per_sqft", 0) for sale in sales) / total_sales
-        )
+        total_sales, price_sum, days_sum, price_per_sqft_sum = totals
 
         return {
             "total_sales": total_sales,
-            "average_sale_price": avg_sale_price,
-            "average_days_on_market": avg_days_on_market,
-            "average_price_per_sqft": avg_price_per_sqft,
+            "average_sale_price": price_sum / total_sales,
+            "average_days_on_market": days_sum / total_sales,
+            "average_price_per_sqft": price_per_sqft_sum / total_sales,
             "area": area or "All Areas",
         }
 
@@ -436,11 +851,7 @@ class RealEstateDataManager:
 
     def get_area_info(self, area_name: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a specific area"""
-        areas = self.get_all_areas()
-        for area in areas:
-            if area.get("name", "").lower() == area_name.lower():
-                return area
-        return None
+        return self._area_by_name_lower.get(area_name.lower())
 
     def get_city_overview(self) -> Dict[str, Any]:
         """Get overall city information"""
@@ -455,32 +866,62 @@ class RealEstateDataManager:
 
     # Cross-referencing and Analytics
     def get_comprehensive_area_report(self, area: str) -> Dict[str, Any]:
-        """Get comprehensive report for an area including properties, market data, amenities"""
-        return {
-            "area_info": self.get_area_info(area),
+        """Get comprehensive report for an area including properties, market data, amenities
+
+        Reports for known area names are cached and shared between calls
+        (read-only).
+        """
+        key = ("area", area)
+        if key in self._report_cache:
+            return self._report_cache[key]
+
+        area_info = self.get_area_info(area)
+        report = {
+            "area_info": area_info,
             "market_data": self.get_area_market_data(area),
             "active_properties": self.get_properties_by_area(area),
             "recent_sales": self.get_sales_by_area(area),
             "amenities": self.get_area_amenities(area),
             "market_trends": self.calculate_market_trends(area),
         }
+        # Only cache areas by their exact name so arbitrary input can't grow
+        # the cache beyond one entry per known area
+        if area_info is not None and area_info.get("name") == area:
+            self._report_cache[key] = report
+        return report
 
     def get_agent_dashboard(self, agent_id: str) -> Dict[str, Any]:
-        """Get comprehensive dashboard for an agent"""
+        """Get comprehensive dashboard for an agent
+
+        Dashboards are cached and shared between calls (read-only).
+        """
+        key = ("agent", agent_id)
+        if key in self._report_cache:
+            return self._report_cache[key]
+
         agent = self.get_agent_by_id(agent_id)
         if not agent:
             return {}
 
-        return {
+        dashboard = {
             "agent_info": agent,
             "performance": self.get_agent_performance(agent_id),
             "active_listings": self.get_properties_by_agent(agent_id),
             "clients": self.get_clients_by_agent(agent_id),
             "recent_sales": self.get_sales_by_agent(agent_id),
         }
+        self._report_cache[key] = dashboard
+        return dashboard
 
     def get_property_insights(self, property_id: str) -> Dict[str, Any]:
-        """Get detailed insights for a property including comparable sales and area info"""
+        """Get detailed insights for a property including comparable sales and area info
+
+        Insights are cached and shared between calls (read-only).
+        """
+        key = ("property", property_id)
+        if key in self._report_cache:
+            return self._report_cache[key]
+
         prop = self.get_property_by_id(property_id)
         if not prop:
             return {}
@@ -488,7 +929,7 @@ class RealEstateDataManager:
         area = prop.get("area")
         agent = self.get_agent_by_id(prop.get("agent_id"))
 
-        return {
+        insights = {
             "property": prop,
             "agent": agent,
             "area_info": self.get_area_info(area),
@@ -496,7 +937,24 @@ class RealEstateDataManager:
             "comparable_sales": self.get_sales_by_area(area),
             "area_amenities": self.get_area_amenities(area),
         }
+        self._report_cache[key] = insights
+        return insights
+
+
+# Global instance, created on first use
+_instance: Optional[RealEstateDataManager] = None
+
+
+def get_data_manager() -> RealEstateDataManager:
+    """Get the shared data manager, creating it on first call"""
+    global _instance
+    if _instance is None:
+        _instance = RealEstateDataManager()
+    return _instance
 
 
-# Global instance
-data_manager = RealEstateDataManager()
+def __getattr__(name: str) -> Any:
+    """Resolve the data_manager module attribute to the shared instance"""
+    if name == "data_manager":
+        return get_data_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")